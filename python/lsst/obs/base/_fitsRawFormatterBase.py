@@ -22,7 +22,9 @@
 __all__ = ("FitsRawFormatterBase",)
 
 import logging
+import os
 from abc import abstractmethod
+from functools import lru_cache
 
 import lsst.afw.fits
 import lsst.afw.geom
@@ -38,6 +40,32 @@ from .utils import InitialSkyWcsError, createInitialSkyWcsFromBoresight
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _readFixedMetadata(path, mtime, translatorClass):
+    """Read the primary header of a raw file and apply header fixes.
+
+    Parameters
+    ----------
+    path : `str`
+        Path to the file.
+    mtime : `int`
+        Modification time of the file in nanoseconds.  Only used as part of
+        the cache key, so that a modified file is read again.
+    translatorClass : `type` or `None`
+        `~astro_metadata_translator.MetadataTranslator` to use when fixing
+        the header.
+
+    Returns
+    -------
+    metadata : `~lsst.daf.base.PropertyList`
+        Fixed header metadata.  This is shared by all callers and must not
+        be modified.
+    """
+    md = lsst.afw.fits.readMetadata(path)
+    fix_header(md, translator_class=translatorClass)
+    return md
+
+
 class FitsRawFormatterBase(FitsImageFormatterBase):
     """Abstract base class for reading and writing raw data to and from
     FITS files.
@@ -50,6 +78,7 @@ class FitsRawFormatterBase(FitsImageFormatterBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._metadata = None
+        self._metadataStripped = False
         self._observationInfo = None
 
     @classmethod
@@ -160,16 +189,24 @@ class FitsRawFormatterBase(FitsImageFormatterBase):
         metadata : `~lsst.daf.base.PropertyList`
             Header metadata.
         """
-        md = lsst.afw.fits.readMetadata(self.fileDescriptor.location.path)
-        fix_header(md, translator_class=self.translatorClass)
-        return md
+        path = self.fileDescriptor.location.path
+        # Headers are cached across formatters since the same raw is often
+        # read several times (e.g. one component at a time).  The cached
+        # metadata is copied because callers strip it.
+        return _readFixedMetadata(path, os.stat(path).st_mtime_ns, self.translatorClass).deepCopy()
 
     def stripMetadata(self):
-        """Remove metadata entries that are parsed into components."""
+        """Remove metadata entries that are parsed into components.
+
+        The metadata is only stripped once; later calls do nothing.
+        """
+        if self._metadataStripped:
+            return
         try:
             lsst.afw.geom.stripWcsMetadata(self.metadata)
         except TypeError as e:
             log.debug("Error caught and ignored while stripping metadata: %s", e.args[0])
+        self._metadataStripped = True
 
     def makeVisitInfo(self):
         """Construct a VisitInfo from metadata.
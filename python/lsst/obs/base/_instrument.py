@@ -21,13 +21,13 @@
 
 from __future__ import annotations
 
-__all__ = ("Instrument", "makeExposureRecordFromObsInfo", "loadCamera")
+__all__ = ("Instrument", "makeExposureRecordFromObsInfo", "makeExposureRecordsFromObsInfos", "loadCamera")
 
 import logging
 import os.path
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Sequence, Set
+from collections.abc import Iterable, Sequence, Set
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
@@ -39,6 +39,7 @@ from lsst.daf.butler import (
     DataCoordinate,
     DataId,
     DatasetType,
+    DimensionElement,
     DimensionRecord,
     DimensionUniverse,
     Timespan,
@@ -205,17 +206,15 @@ class Instrument(InstrumentBase):
             If `True` (`False` is default), update existing records if they
             differ from the new ones.
         """
-        for filter in self.filterDefinitions:
-            # fix for undefined abstract filters causing trouble in the
-            # registry:
-            if filter.band is None:
-                band = filter.physical_filter
-            else:
-                band = filter.band
-
+        instrument = self.getName()
+        # Filters without a band use their physical filter name as the band,
+        # since undefined abstract filters cause trouble in the registry.
+        # Records are synced one at a time, rather than inserted in bulk, so
+        # that existing records are still checked for consistency.
+        for physical_filter, band in self.filterDefinitions.resolved_pairs:
             registry.syncDimensionData(
                 "physical_filter",
-                {"instrument": self.getName(), "name": filter.physical_filter, "band": band},
+                {"instrument": instrument, "name": physical_filter, "band": band},
                 update=update,
             )
 
@@ -402,9 +401,13 @@ class Instrument(InstrumentBase):
             )
 
     @classmethod
+    @lru_cache
     def _getSpecificCuratedCalibrationPath(cls, datasetTypeName: str) -> str | None:
         """Return the path of the curated calibration directory.
 
+        The result is cached, since the contents of the obs data package are
+        not expected to change within a process.
+
         Parameters
         ----------
         datasetTypeName : `str`
@@ -573,10 +576,64 @@ def makeExposureRecordFromObsInfo(
         a `Registry`.
     """
     dimension = universe["exposure"]
+    return _makeExposureRecord(obsInfo, dimension, dimension.metadata.names, **kwargs)
+
+
+def makeExposureRecordsFromObsInfos(
+    obsInfos: Iterable[ObservationInfo], universe: DimensionUniverse, **kwargs: Any
+) -> list[DimensionRecord]:
+    """Construct exposure DimensionRecords from multiple
+    `astro_metadata_translator.ObservationInfo` objects.
+
+    This is equivalent to calling `makeExposureRecordFromObsInfo` on each
+    of the ``obsInfos``, but only looks up the exposure dimension once.
+
+    Parameters
+    ----------
+    obsInfos : `~collections.abc.Iterable` [ \
+            `astro_metadata_translator.ObservationInfo` ]
+        `~astro_metadata_translator.ObservationInfo` objects, each
+        corresponding to one exposure.
+    universe : `DimensionUniverse`
+        Set of all known dimensions.
+    **kwargs
+        Additional field values for every record.
 
-    # Some registries support additional items.
-    supported = {meta.name for meta in dimension.metadata}
+    Returns
+    -------
+    records : `list` [ `DimensionRecord` ]
+        Records containing exposure metadata, in the same order as
+        ``obsInfos``.  These can be inserted into a `Registry` with a single
+        call to `~lsst.daf.butler.Registry.insertDimensionData`.
+    """
+    dimension = universe["exposure"]
+    supported = dimension.metadata.names
+    return [_makeExposureRecord(obsInfo, dimension, supported, **kwargs) for obsInfo in obsInfos]
 
+
+def _makeExposureRecord(
+    obsInfo: ObservationInfo, dimension: DimensionElement, supported: Set[str], **kwargs: Any
+) -> DimensionRecord:
+    """Construct an exposure DimensionRecord for an already resolved
+    exposure dimension.
+
+    Parameters
+    ----------
+    obsInfo : `astro_metadata_translator.ObservationInfo`
+        A `~astro_metadata_translator.ObservationInfo` object corresponding to
+        the exposure.
+    dimension : `DimensionElement`
+        The exposure dimension.
+    supported : `~collections.abc.Set` [ `str` ]
+        Names of the optional metadata fields supported by ``dimension``.
+    **kwargs
+        Additional field values for this record.
+
+    Returns
+    -------
+    record : `DimensionRecord`
+        A record containing exposure metadata.
+    """
     ra, dec, sky_angle, azimuth, zenith_angle = (None, None, None, None, None)
     if obsInfo.tracking_radec is not None:
         icrs = obsInfo.tracking_radec.icrs
@@ -23,18 +23,34 @@ from __future__ import annotations
 
 __all__ = ["CuratedCalibration", "read_all"]
 
-import glob
+import datetime
+import itertools
 import os
+import re
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Protocol
 
 import dateutil.parser
 
 if TYPE_CHECKING:
-    import datetime
-
     import lsst.afw.cameraGeom
 
+# File extensions of curated calibrations that can be read by ``readText``.
+_CALIB_EXTENSIONS = (".ecsv", ".yaml", ".json")
+
+# Maximum number of threads used by `read_all` to read calibration paths.
+_MAX_READ_WORKERS = 8
+
+# Formats tried before falling back to the much slower heuristic parsing of
+# `dateutil`.  strptime accepts single-digit fields, so the compact formats are
+# only used for names whose digit counts match them exactly; each such name
+# then has a single possible format, chosen by its length.
+_EXTENDED_DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d")
+_COMPACT_DATE_RE = re.compile(r"\d{8}(T\d{4}(\d{2})?)?", re.IGNORECASE)
+_COMPACT_DATE_FORMATS = {8: "%Y%m%d", 13: "%Y%m%dT%H%M", 15: "%Y%m%dT%H%M%S"}
+
 
 class CuratedCalibration(Protocol):
     """Protocol that describes the methods needed by this class when dealing
@@ -49,6 +65,36 @@ class CuratedCalibration(Protocol):
         ...
 
 
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> datetime.datetime:
+    """Parse the validity start date encoded in a curated calibration file
+    name.
+
+    Results are cached since calibrations for different detectors are
+    usually issued with the same validity start dates.
+
+    Parameters
+    ----------
+    date_str : `str`
+        The file name stem to parse.
+
+    Returns
+    -------
+    date : `datetime.datetime`
+        The parsed date.
+    """
+    if _COMPACT_DATE_RE.fullmatch(date_str):
+        date_formats: tuple[str, ...] = (_COMPACT_DATE_FORMATS[len(date_str)],)
+    else:
+        date_formats = _EXTENDED_DATE_FORMATS
+    for date_format in date_formats:
+        try:
+            return datetime.datetime.strptime(date_str, date_format)
+        except ValueError:
+            pass
+    return dateutil.parser.parse(date_str)
+
+
 def read_one_calib(
     path: tuple[str, ...],
     chip_id: int | None,
@@ -84,6 +130,12 @@ def read_one_calib(
         The type of calibrations that have been read and are included
         in the ``data_dict``.
 
+    Raises
+    ------
+    ValueError
+        Raised if more than one file has the same validity start time, or
+        if the metadata of a file does not match its path.
+
     Notes
     -----
     Curated calibrations are read from the appropriate ``obs_ _data``
@@ -107,20 +159,31 @@ def read_one_calib(
     (i.e., transmission_system), have physical filter named
     directories below the detector level directories.
     """
-    files = []
-    extensions = (".ecsv", ".yaml", ".json")
-    for ext in extensions:
-        files.extend(glob.glob(os.path.join(*path, f"*{ext}")))
+    # A single directory scan is cheaper than one glob per extension.
+    # Hidden files are skipped to match the previous glob behavior.  Every
+    # name kept ends with a known extension, so the date string is simply
+    # everything before the last dot.
+    with os.scandir(os.path.join(*path)) as entries:
+        files = [
+            (entry.path, entry.name.rpartition(".")[0])
+            for entry in entries
+            if entry.name.endswith(_CALIB_EXTENSIONS) and not entry.name.startswith(".") and entry.is_file()
+        ]
 
     parts = os.path.split(path[0])
     instrument = os.path.split(parts[0])[1]  # convention is that these reside at <instrument>/<calib_type>
     calib_type = parts[1]
+    # These are the same for every file, so only convert them once.
+    path_lower = _lower_path_metadata(instrument, filter_name, calib_type)
     data_dict: dict[datetime.datetime, Any] = {}
-    for f in files:
-        date_str = os.path.splitext(os.path.basename(f))[0]
-        valid_start = dateutil.parser.parse(date_str)
-        data_dict[valid_start] = calib_class.readText(f)
-        check_metadata(data_dict[valid_start], valid_start, instrument, chip_id, filter_name, f, calib_type)
+    for f, date_str in files:
+        valid_start = _parse_date(date_str)
+        # Which file would win depends on the directory order, so
+        # duplicates are an error rather than silently overwritten.
+        if valid_start in data_dict:
+            raise ValueError(f"Multiple files in {os.path.join(*path)} have validity start {valid_start}")
+        data_dict[valid_start] = calib = calib_class.readText(f)
+        _check_metadata(calib.getMetadata(), instrument, chip_id, filter_name, f, calib_type, path_lower)
     return data_dict, calib_type
 
 
@@ -163,7 +226,78 @@ def check_metadata(
         If the metadata from the path and the metadata encoded
         in the path do not match for any reason.
     """
-    md = obj.getMetadata()
+    _check_metadata(
+        obj.getMetadata(),
+        instrument,
+        chip_id,
+        filter_name,
+        filepath,
+        calib_type,
+        _lower_path_metadata(instrument, filter_name, calib_type),
+    )
+
+
+def _lower_path_metadata(
+    instrument: str, filter_name: str | None, calib_type: str
+) -> tuple[str, str | None, str]:
+    """Convert the path metadata compared by `_check_metadata` to lower
+    case.
+
+    Parameters
+    ----------
+    instrument : `str`
+        Name of the instrument in question.
+    filter_name : `str` or `None`
+        Identifier of the filter in question.
+    calib_type : `str`
+        Name of the type of data being read.
+
+    Returns
+    -------
+    path_lower : `tuple` [`str`, `str` or `None`, `str`]
+        The lower case ``instrument``, ``filter_name`` and ``calib_type``.
+    """
+    return instrument.lower(), filter_name.lower() if filter_name is not None else None, calib_type.lower()
+
+
+def _check_metadata(
+    md: Mapping,
+    instrument: str,
+    chip_id: int | None,
+    filter_name: str | None,
+    filepath: str,
+    calib_type: str,
+    path_lower: tuple[str, str | None, str],
+) -> None:
+    """Check file metadata against path values converted to lower case.
+
+    This is the implementation of `check_metadata`, and allows callers
+    checking many files from the same path to do that conversion only once.
+
+    Parameters
+    ----------
+    md : `~collections.abc.Mapping`
+        Metadata of the object read from the file.
+    instrument : `str`
+        Name of the instrument in question.
+    chip_id : `int`
+        Identifier of the sensor in question.
+    filter_name : `str`
+        Identifier of the filter in question.
+    filepath : `str`
+        Path of the file read to construct the data.
+    calib_type : `str`
+        Name of the type of data being read.
+    path_lower : `tuple` [`str`, `str` or `None`, `str`]
+        The lower case ``instrument``, ``filter_name`` and ``calib_type``,
+        as returned by `_lower_path_metadata`; these are what is compared.
+
+    Raises
+    ------
+    ValueError
+        If the metadata from the path and the metadata encoded
+        in the path do not match for any reason.
+    """
     # It is an error if these two do not exist.
     finst = md["INSTRUME"]
     fcalib_type = md["OBSTYPE"]
@@ -171,24 +305,43 @@ def check_metadata(
     fchip_id = md.get("DETECTOR", None)
     ffilter_name = md.get("FILTER", None)
 
+    instrument_lower, filter_name_lower, calib_type_lower = path_lower
     if chip_id is not None:
         fchip_id = int(fchip_id)
     if filter_name is not None:
         ffilter_name = ffilter_name.lower()
-        filter_name = filter_name.lower()
 
-    if not (
-        (finst.lower(), fchip_id, ffilter_name, fcalib_type.lower())
-        == (instrument.lower(), chip_id, filter_name, calib_type.lower())
+    if (
+        fchip_id != chip_id
+        or ffilter_name != filter_name_lower
+        or finst.lower() != instrument_lower
+        or fcalib_type.lower() != calib_type_lower
     ):
         raise ValueError(
             "Path and file metadata do not agree:\n"
-            f"Path metadata: {instrument} {chip_id} {filter_name} {calib_type}\n"
+            f"Path metadata: {instrument} {chip_id} {filter_name_lower} {calib_type}\n"
             f"File metadata: {finst} {fchip_id} {ffilter_name} {fcalib_type}\n"
             f"File read from : {filepath}\n"
         )
 
 
+def _list_subdirectories(path: str) -> list[str]:
+    """Return the names of the directories directly within a directory.
+
+    Parameters
+    ----------
+    path : `str`
+        The directory to scan.
+
+    Returns
+    -------
+    names : `list` [`str`]
+        Names of the subdirectories, relative to ``path``.
+    """
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
+
+
 def read_all(
     root: str,
     camera: lsst.afw.cameraGeom.Camera,
@@ -209,6 +362,8 @@ def read_all(
     calib_class : `Any`
         The class to use to read the curated calibration text file. Must
         support the ``readText()`` and ``getMetadata()`` methods.
+        ``readText()`` must be thread-safe, since separate paths may be read
+        concurrently.
     required_dimensions : `list` [`str`]
         Dimensions required for the calibration.
     filters : `list` [`str`]
@@ -235,14 +390,15 @@ def read_all(
     calibration_data = {}
 
     root = os.path.normpath(root)
-    dirs = os.listdir(root)  # assumes all directories contain data
-    dirs = [d for d in dirs if os.path.isdir(os.path.join(root, d))]
+    dirs = _list_subdirectories(root)  # assumes all directories contain data
     if not dirs:
         dirs = [root]
 
-    calib_types = set()
-    # We assume the directories have been lowered.
-    detector_map = {det.getName().lower(): det.getName() for det in camera}
+    # We assume the directories have been lowered.  The camera is only
+    # walked if the directories are expected to be named after detectors.
+    detector_map: dict[str, lsst.afw.cameraGeom.Detector] = {}
+    if "detector" in required_dimensions:
+        detector_map = {det.getName().lower(): det for det in camera}
     filter_map = {filterName.lower().replace(" ", "_"): filterName for filterName in filters}
 
     paths_to_search: list[tuple[str, ...]] = []
@@ -268,10 +424,7 @@ def read_all(
                 # If the calibration depends on both detector and
                 # physical_filter, the subdirs here should contain the
                 # filter name.
-                subdirs = os.listdir(os.path.join(root, dir_name))
-                subdirs = [d for d in subdirs if os.path.isdir(os.path.join(root, dir_name, d))]
-                for sd in subdirs:
-                    subdir_name = os.path.basename(sd)
+                for subdir_name in _list_subdirectories(os.path.join(root, dir_name)):
                     if subdir_name not in filter_map:
                         raise RuntimeError(f"Filter {subdir_name} not known to supplied camera.")
                     else:
@@ -291,21 +444,35 @@ def read_all(
             # subdirectories.
             paths_to_search.append((root,))
 
+    chip_ids: list[int | None] = []
+    filter_names: list[str | None] = []
     for path in paths_to_search:
         chip_id = None
         filter_name = None
         if "detector" in required_dimensions:
-            chip_id = camera[detector_map[path[1]]].getId()
+            chip_id = detector_map[path[1]].getId()
         if "physical_filter" in required_dimensions:
             filter_name = filter_map[path[-1]]
-
-        calibration_data[path], calib_type = read_one_calib(path, chip_id, filter_name, calib_class)
-
-        calib_types.add(calib_type)
-        if len(calib_types) != 1:  # set.add(None) has length 1 so None is OK here.
-            raise ValueError(f"Error mixing calib types: {calib_types}")
-
-    no_data = all([v == {} for v in calibration_data.values()])
+        chip_ids.append(chip_id)
+        filter_names.append(filter_name)
+
+    # Each path is read independently and the cost is dominated by file I/O
+    # and parsing, so read them concurrently when there is more than one.
+    # Results are returned in the order of ``paths_to_search``.
+    read_args = (paths_to_search, chip_ids, filter_names, itertools.repeat(calib_class))
+    if len(paths_to_search) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(paths_to_search), _MAX_READ_WORKERS)) as executor:
+            results = list(executor.map(read_one_calib, *read_args))
+    else:
+        results = list(map(read_one_calib, *read_args))
+    for i, (path, (data_dict, path_calib_type)) in enumerate(zip(paths_to_search, results, strict=True)):
+        calibration_data[path] = data_dict
+        if i == 0:
+            calib_type = path_calib_type
+        elif path_calib_type != calib_type:
+            raise ValueError(f"Error mixing calib types: {calib_type}, {path_calib_type}")
+
+    no_data = not any(calibration_data.values())
     if no_data:
         raise RuntimeError("No data to ingest")
 
@@ -124,9 +124,22 @@ class FilterDefinitionCollection(Sequence[FilterDefinition]):
     iterating over the entire collection.
     """
 
+    resolved_pairs: tuple[tuple[str, str], ...]
+    """The ``(physical_filter, band)`` pairs of the filters in this
+    collection, in order, with the physical filter name used as the band for
+    filters that do not define one.
+
+    These are the values used to define ``physical_filter`` dimension
+    records.
+    """
+
     def __init__(self, *filters: FilterDefinition):
         self._filters = list(filters)
         self.physical_to_band = {filter.physical_filter: filter.band for filter in self._filters}
+        self.resolved_pairs = tuple(
+            (filter.physical_filter, filter.band if filter.band is not None else filter.physical_filter)
+            for filter in self._filters
+        )
 
     @overload
     def __getitem__(self, i: int) -> FilterDefinition:
@@ -27,10 +27,12 @@ __all__ = (
     "standardizeAmplifierParameters",
 )
 
+import copy
 import warnings
 from abc import abstractmethod
-from collections.abc import Set
-from typing import ClassVar
+from collections.abc import Mapping, Set
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from lsst.afw.cameraGeom import AmplifierGeometryComparison, AmplifierIsolator
 from lsst.afw.image import (
@@ -50,6 +52,31 @@ from lsst.utils.classes import cached_getter
 from lsst.utils.introspection import find_outside_stacklevel
 
 
+# Schemas for image compression recipes define what should be there, and the
+# default values (and by the default value, the expected type).
+_COMPRESSION_SCHEMA: Mapping[str, Any] = MappingProxyType(
+    {
+        "algorithm": "NONE",
+        "rows": 1,
+        "columns": 0,
+        "quantizeLevel": 0.0,
+    }
+)
+_SCALING_SCHEMA: Mapping[str, Any] = MappingProxyType(
+    {
+        "algorithm": "NONE",
+        "bitpix": 0,
+        "maskPlanes": ["NO_DATA"],
+        "seed": 0,
+        "quantizeLevel": 4.0,
+        "quantizePad": 5.0,
+        "fuzz": True,
+        "bscale": 1.0,
+        "bzero": 0.0,
+    }
+)
+
+
 class FitsImageFormatterBase(Formatter):
     """Base class formatter for image-like storage classes stored via FITS.
 
@@ -297,18 +324,28 @@ class StandardFitsImageFormatterBase(ReaderFitsImageFormatterBase):
         if recipeName not in self.writeRecipes:
             raise RuntimeError(f"Unrecognized recipe option given for compression: {recipeName}")
 
-        recipe = self.writeRecipes[recipeName]
+        # Copy the recipe so that a seed set for this dataId is not seen by
+        # later writes that use the same recipe.
+        recipe = copy.deepcopy(self.writeRecipes[recipeName])
 
         # Set the seed based on dataId
-        seed = hash(tuple(self.dataId.required.items())) % 2**31
         for plane in ("image", "mask", "variance"):
             if plane in recipe and "scaling" in recipe[plane]:
                 scaling = recipe[plane]["scaling"]
                 if "seed" in scaling and scaling["seed"] == 0:
-                    scaling["seed"] = seed
+                    scaling["seed"] = self._dataIdSeed
 
         return recipe
 
+    @property
+    @cached_getter
+    def _dataIdSeed(self):
+        """Seed for fuzzing derived from the data ID (`int`).
+
+        This is computed on first use and then cached.
+        """
+        return hash(tuple(self.dataId.required.items())) % 2**31
+
     @classmethod
     def validateWriteRecipes(cls, recipes):
         """Validate supplied recipes for this formatter.
@@ -333,26 +370,6 @@ class StandardFitsImageFormatterBase(ReaderFitsImageFormatterBase):
         RuntimeError
             Raised if validation fails.
         """
-        # Schemas define what should be there, and the default values (and by
-        # the default value, the expected type).
-        compressionSchema = {
-            "algorithm": "NONE",
-            "rows": 1,
-            "columns": 0,
-            "quantizeLevel": 0.0,
-        }
-        scalingSchema = {
-            "algorithm": "NONE",
-            "bitpix": 0,
-            "maskPlanes": ["NO_DATA"],
-            "seed": 0,
-            "quantizeLevel": 4.0,
-            "quantizePad": 5.0,
-            "fuzz": True,
-            "bscale": 1.0,
-            "bzero": 0.0,
-        }
-
         if not recipes:
             # We can not insist on recipes being specified
             return recipes
@@ -375,17 +392,18 @@ class StandardFitsImageFormatterBase(ReaderFitsImageFormatterBase):
 
                 np = {}
                 validated[name][plane] = np
-                for settings, schema in (("compression", compressionSchema), ("scaling", scalingSchema)):
-                    np[settings] = {}
-                    if settings not in recipes[name][plane]:
-                        for key in schema:
-                            np[settings][key] = schema[key]
-                        continue
-                    entry = recipes[name][plane][settings]
-                    checkUnrecognized(entry, schema.keys(), f"{name}->{plane}->{settings}")
-                    for key in schema:
-                        value = type(schema[key])(entry[key]) if key in entry else schema[key]
-                        np[settings][key] = value
+                for settings, schema in (("compression", _COMPRESSION_SCHEMA), ("scaling", _SCALING_SCHEMA)):
+                    if settings in recipes[name][plane]:
+                        entry = recipes[name][plane][settings]
+                        checkUnrecognized(entry, schema.keys(), f"{name}->{plane}->{settings}")
+                    else:
+                        entry = {}
+                    # Defaults are copied so that no validated recipe shares
+                    # a mutable value (e.g. maskPlanes) with the schema.
+                    np[settings] = {
+                        key: type(default)(entry[key]) if key in entry else copy.deepcopy(default)
+                        for key, default in schema.items()
+                    }
         return validated
 
 
@@ -509,18 +527,18 @@ class FitsExposureFormatter(FitsMaskedImageFormatter):
 
     ReaderClass = ExposureFitsReader
 
-    def readComponent(self, component):
-        # Docstring inherited.
-        # Generic components can be read via a string name; DM-27754 will make
-        # this mapping larger at the expense of the following one.
-        genericComponents = {
+    # Generic components can be read via a string name; DM-27754 will make
+    # this mapping larger at the expense of the following one.
+    _genericComponents: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
             "summaryStats": ExposureInfo.KEY_SUMMARY_STATS,
         }
-        if (genericComponentName := genericComponents.get(component)) is not None:
-            return self.reader.readComponent(genericComponentName)
-        # Other components have hard-coded method names, but don't take
-        # parameters.
-        standardComponents = {
+    )
+
+    # Other components have hard-coded method names, but don't take
+    # parameters.
+    _standardComponents: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
             "id": "readExposureId",
             "metadata": "readMetadata",
             "wcs": "readWcs",
@@ -535,7 +553,13 @@ class FitsExposureFormatter(FitsMaskedImageFormatter):
             "detector": "readDetector",
             "exposureInfo": "readExposureInfo",
         }
-        if (methodName := standardComponents.get(component)) is not None:
+    )
+
+    def readComponent(self, component):
+        # Docstring inherited.
+        if (genericComponentName := self._genericComponents.get(component)) is not None:
+            return self.reader.readComponent(genericComponentName)
+        if (methodName := self._standardComponents.get(component)) is not None:
             result = getattr(self.reader, methodName)()
             if component == "filter":
                 return self._fixFilterLabels(result)
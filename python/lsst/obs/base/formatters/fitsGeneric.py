@@ -50,15 +50,22 @@ class FitsGenericFormatter(FileFormatter):
             Instance of class `pytype` read from FITS file. None
             if the file could not be opened.
         """
-        if not os.path.exists(path):
-            return None
-        if self.fileDescriptor.parameters:
-            try:
-                return pytype.readFitsWithOptions(path, options=self.fileDescriptor.parameters)
-            except AttributeError:
-                pass
+        try:
+            if self.fileDescriptor.parameters:
+                # Not every type supports options; look the method up rather
+                # than relying on an AttributeError to fall back.
+                readFitsWithOptions = getattr(pytype, "readFitsWithOptions", None)
+                if readFitsWithOptions is not None:
+                    return readFitsWithOptions(path, options=self.fileDescriptor.parameters)
 
-        return pytype.readFits(path)
+            return pytype.readFits(path)
+        except Exception:
+            # Readers do not report a missing file consistently (afw raises
+            # FitsError), so only check for one after a failure rather than
+            # paying for an extra stat on every successful read.
+            if not os.path.exists(path):
+                return None
+            raise
 
     def _writeFile(self, inMemoryDataset):
         """Write the in memory dataset to file on disk.
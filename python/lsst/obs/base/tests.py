@@ -38,6 +38,8 @@ from lsst.afw.image import Exposure
 
 from . import butler_tests, camera_tests
 
+_LOG = logging.getLogger(__name__)
+
 
 class ObsTests(butler_tests.ButlerGetTests, camera_tests.CameraTests):
     """Aggregator class for all of the obs_* test classes.
@@ -88,12 +90,49 @@ class ObsTests(butler_tests.ButlerGetTests, camera_tests.CameraTests):
         """
         self.butler = butler
         self.dataIds = dataIds
-        self.log = logging.getLogger(__name__)
+        self.log = _LOG
+
+    @classmethod
+    def setUpClass_tests(cls, butler, dataIds):
+        """Set up the shared variables used by multiple tests once for the
+        whole test class.
+
+        This is an alternative to calling `setUp_tests` from ``setUp`` for
+        packages where the butler is expensive to construct; call it from
+        ``setUpClass`` instead and the same butler will be used by every
+        test in the class::
+
+            @classmethod
+            def setUpClass(cls):
+                cls.setUpClass_tests(...)
+
+        Parameters
+        ----------
+        butler: `lsst.daf.butler.Butler`
+            A butler object, instantiated on the testdata repository for the
+            obs package being tested.
+        dataIds: `dict`
+            dictionary of (exposure name): (dataId of that exposure in the
+            testdata repository); see `setUp_tests`.
+        """
+        cls.butler = butler
+        cls.dataIds = dataIds
+        cls.log = _LOG
 
     def tearDown(self):
-        del self.butler
+        # A butler shared by the class (see setUpClass_tests) is left alone.
+        if "butler" in vars(self):
+            del self.butler
         super().tearDown()
 
+    @classmethod
+    def tearDownClass(cls):
+        # Only remove what setUpClass_tests set on this class itself.
+        for name in ("butler", "dataIds", "log"):
+            if name in vars(cls):
+                delattr(cls, name)
+        super().tearDownClass()
+
 
 def make_ramp_array(bbox, pedestal):
     """Make a 2-d ramp array.
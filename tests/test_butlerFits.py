@@ -36,10 +36,18 @@ from lsst.afw.fits import readMetadata
 from lsst.afw.image import LOCAL, ExposureFitsReader, MaskedImageFitsReader
 from lsst.afw.math import flipImage
 from lsst.daf.base import PropertyList, PropertySet
-from lsst.daf.butler import Config, DatasetType, StorageClassFactory
+from lsst.daf.butler import (
+    Config,
+    DataCoordinate,
+    DatasetType,
+    DimensionUniverse,
+    FileDescriptor,
+    StorageClassFactory,
+)
 from lsst.daf.butler.tests import addDatasetType, makeTestCollection, makeTestRepo
 from lsst.geom import Box2I, Extent2I, Point2I
 from lsst.obs.base.exposureAssembler import ExposureAssembler
+from lsst.obs.base.formatters.fitsExposure import FitsExposureFormatter
 from lsst.obs.base.tests import make_ramp_exposure_trimmed, make_ramp_exposure_untrimmed
 
 if TYPE_CHECKING:
@@ -480,5 +488,45 @@ class ButlerFitsTests(lsst.utils.tests.TestCase):
                 self.assertImagesEqual(subVariance, mi.variance[bbox])
 
 
+class FitsExposureFormatterRecipeTests(lsst.utils.tests.TestCase):
+    """Tests for the handling of FITS compression write recipes."""
+
+    def testValidatedDefaultsNotShared(self):
+        """Test that validated recipes do not share mutable defaults."""
+        recipes = {
+            "first": {"image": {}, "mask": {}, "variance": {}},
+            "second": {"image": {"scaling": {"algorithm": "STDEV_POSITIVE"}}, "mask": {}, "variance": {}},
+        }
+        validated = FitsExposureFormatter.validateWriteRecipes(recipes)
+        validated["first"]["image"]["scaling"]["maskPlanes"].append("SAT")
+        self.assertEqual(validated["first"]["mask"]["scaling"]["maskPlanes"], ["NO_DATA"])
+        self.assertEqual(validated["second"]["image"]["scaling"]["maskPlanes"], ["NO_DATA"])
+        validated = FitsExposureFormatter.validateWriteRecipes(recipes)
+        self.assertEqual(validated["first"]["image"]["scaling"]["maskPlanes"], ["NO_DATA"])
+
+    def testCompressionSeed(self):
+        """Test that the fuzzing seed comes from the data ID and is not
+        written back into the formatter's recipes.
+        """
+        recipes = {
+            "lossy": {
+                "image": {"scaling": {"algorithm": "STDEV_POSITIVE", "bitpix": 16}},
+                "mask": {},
+                "variance": {},
+            }
+        }
+        universe = DimensionUniverse()
+        seeds = []
+        for detector in (1, 2):
+            dataId = DataCoordinate.standardize(instrument="Cam1", detector=detector, universe=universe)
+            formatter = FitsExposureFormatter(FileDescriptor(None, None), dataId, writeRecipes=recipes)
+            for _ in range(2):
+                settings = formatter.getImageCompressionSettings("lossy")
+                self.assertNotEqual(settings["image"]["scaling"]["seed"], 0)
+                self.assertEqual(formatter.writeRecipes["lossy"]["image"]["scaling"]["seed"], 0)
+            seeds.append(settings["image"]["scaling"]["seed"])
+        self.assertNotEqual(seeds[0], seeds[1])
+
+
 if __name__ == "__main__":
     unittest.main()
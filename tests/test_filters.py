@@ -54,6 +54,11 @@ class TestFilterDefinitionCollection(lsst.utils.tests.TestCase):
         self.assertIsNone(self.filters2.physical_to_band["abc"])
         self.assertEqual(self.filters2.physical_to_band["def"], "dd")
 
+    def test_resolved_pairs(self):
+        """Test that filters without a band use their physical filter name."""
+        self.assertEqual(self.filters1.resolved_pairs, (("abc", "abc"), ("def", "d")))
+        self.assertEqual(self.filters2.resolved_pairs, (("abc", "abc"), ("def", "dd")))
+
 
 class TestFilterDefinition(lsst.utils.tests.TestCase):
     """Test filter definition."""
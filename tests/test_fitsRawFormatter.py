@@ -19,10 +19,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+import shutil
+import tempfile
 import unittest
+import unittest.mock
 
 import astropy.units as u
+import lsst.afw.fits
 import lsst.afw.geom
+import lsst.afw.image
 import lsst.afw.math
 import lsst.daf.base
 import lsst.daf.butler
@@ -40,6 +46,7 @@ from lsst.obs.base import (
     FitsRawFormatterBase,
     MakeRawVisitInfoViaObsInfo,
 )
+from lsst.obs.base._fitsRawFormatterBase import _readFixedMetadata
 from lsst.obs.base.tests import make_ramp_exposure_untrimmed
 from lsst.obs.base.utils import InitialSkyWcsError, createInitialSkyWcs
 
@@ -244,6 +251,78 @@ class FitsRawFormatterTestCase(lsst.utils.tests.TestCase):
                 # - these are kind of expensive tests.
 
 
+class RawMetadataCacheTestCase(lsst.utils.tests.TestCase):
+    """Test the caching of raw headers shared between formatters."""
+
+    def setUp(self):
+        _readFixedMetadata.cache_clear()
+        self.addCleanup(_readFixedMetadata.cache_clear)
+        tmpDir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpDir, ignore_errors=True)
+        self.path = os.path.join(tmpDir, "raw.fits")
+        metadata = lsst.daf.base.PropertyList()
+        metadata.update(
+            {
+                "CTYPE1": "RA---SIN",
+                "CTYPE2": "DEC--SIN",
+                "CRPIX1": 5,
+                "CRPIX2": 6,
+                "CRVAL1": 11.0,
+                "CRVAL2": 21.0,
+                "CD1_1": 1e-5,
+                "CD1_2": 0,
+                "CD2_2": 1e-5,
+                "CD2_1": 0,
+            }
+        )
+        lsst.afw.image.ImageU(3, 4).writeFits(self.path, metadata=metadata)
+        universe = lsst.daf.butler.DimensionUniverse()
+        self.dataId = lsst.daf.butler.DataCoordinate.standardize(
+            instrument="Cam1", exposure=2, detector=10, physical_filter="u", band="u", universe=universe
+        )
+
+    def makeFormatter(self):
+        return SimpleFitsRawFormatter(
+            lsst.daf.butler.FileDescriptor(
+                lsst.daf.butler.Location(None, path=lsst.resources.ResourcePath(self.path)),
+                lsst.daf.butler.StorageClassFactory().getStorageClass("ExposureI"),
+            ),
+            self.dataId,
+        )
+
+    def test_read_once(self):
+        """Test that formatters on the same file share one header read."""
+        with unittest.mock.patch("lsst.afw.fits.readMetadata", wraps=lsst.afw.fits.readMetadata) as mock:
+            formatter1 = self.makeFormatter()
+            formatter2 = self.makeFormatter()
+            self.assertEqual(formatter1.metadata["CTYPE1"], "RA---SIN")
+            self.assertEqual(formatter2.metadata["CTYPE1"], "RA---SIN")
+            self.assertEqual(mock.call_count, 1)
+
+    def test_strip_does_not_modify_cache(self):
+        """Test that stripping one formatter's metadata leaves the cached
+        header and other formatters' metadata intact.
+        """
+        formatter1 = self.makeFormatter()
+        formatter2 = self.makeFormatter()
+        self.assertIn("CTYPE1", formatter2.metadata)
+        formatter1.stripMetadata()
+        self.assertNotIn("CTYPE1", formatter1.metadata)
+        self.assertIn("CTYPE1", formatter2.metadata)
+        self.assertIn("CTYPE1", self.makeFormatter().metadata)
+        mtime = os.stat(self.path).st_mtime_ns
+        self.assertIn("CTYPE1", _readFixedMetadata(self.path, mtime, SimpleTestingTranslator))
+
+    def test_modified_file_is_read_again(self):
+        """Test that a changed modification time forces a fresh read."""
+        with unittest.mock.patch("lsst.afw.fits.readMetadata", wraps=lsst.afw.fits.readMetadata) as mock:
+            self.makeFormatter().metadata
+            stat = os.stat(self.path)
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.makeFormatter().metadata
+            self.assertEqual(mock.call_count, 2)
+
+
 class MemoryTester(lsst.utils.tests.MemoryTestCase):
     """Check for file leaks."""
 
@@ -25,7 +25,12 @@
 import datetime
 import unittest
 
-from lsst.obs.base import Instrument
+import astropy.units as u
+from astro_metadata_translator import ObservationInfo
+from astropy.coordinates import SkyCoord
+from astropy.time import Time
+from lsst.daf.butler import DimensionUniverse
+from lsst.obs.base import Instrument, makeExposureRecordFromObsInfo, makeExposureRecordsFromObsInfos
 from lsst.obs.base.instrument_tests import DummyCam, InstrumentTestData, InstrumentTests
 
 
@@ -64,6 +69,45 @@ class InstrumentTestCase(InstrumentTests, unittest.TestCase):
         datetimeThen1 = datetime.datetime.strptime(formattedNow, "%Y%m%dT%H%M%S%z")
         self.assertEqual(datetimeThen1.tzinfo, datetime.timezone.utc)
 
+    def test_makeExposureRecordsFromObsInfos(self):
+        universe = DimensionUniverse()
+        if "can_see_sky" not in universe["exposure"].metadata.names:
+            self.skipTest("Dimension universe does not define exposure.can_see_sky")
+        obsInfos = [
+            ObservationInfo.makeObservationInfo(
+                instrument="DummyCam",
+                exposure_id=exposure_id,
+                observation_id=f"DUMMY_{exposure_id}",
+                exposure_group=f"group_{exposure_id}",
+                visit_id=exposure_id,
+                datetime_begin=Time(60000.0 + exposure_id, format="mjd", scale="tai"),
+                datetime_end=Time(60000.0 + exposure_id + 0.001, format="mjd", scale="tai"),
+                exposure_time=30.0 * u.s,
+                dark_time=31.0 * u.s,
+                observation_type="science",
+                observation_reason="test",
+                observing_day=20230225,
+                observation_counter=exposure_id,
+                physical_filter="dummy_g",
+                science_program="test",
+                object="field",
+                tracking_radec=SkyCoord(10.0 * exposure_id, -30.0, unit="deg", frame="icrs"),
+                boresight_rotation_coord="sky",
+                boresight_rotation_angle=45.0 * u.deg,
+                has_simulated_content=False,
+                group_counter_start=exposure_id,
+                group_counter_end=exposure_id,
+            )
+            for exposure_id in (3, 1, 2)
+        ]
+        records = makeExposureRecordsFromObsInfos(obsInfos, universe, can_see_sky=True)
+        expected = [
+            makeExposureRecordFromObsInfo(obsInfo, universe, can_see_sky=True) for obsInfo in obsInfos
+        ]
+        self.assertEqual([record.toDict() for record in records], [record.toDict() for record in expected])
+        self.assertEqual([record.id for record in records], [3, 1, 2])
+        self.assertTrue(all(record.can_see_sky for record in records))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+# This file is part of obs_base.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import unittest
+
+import lsst.utils.tests
+from lsst.obs.base.tests import ObsTests
+
+
+class ObsTestsTearDownTestCase(lsst.utils.tests.TestCase):
+    """Test the butler clean up done by ObsTests."""
+
+    def testSharedButler(self):
+        # Defined here so that the ObsTests tests are not collected.
+        class SharedButlerTests(ObsTests, unittest.TestCase):
+            pass
+
+        classButler = object()
+        SharedButlerTests.setUpClass_tests(classButler, {})
+        case = SharedButlerTests()
+        case.tearDown()
+        self.assertIs(SharedButlerTests.butler, classButler)
+
+        case.setUp_tests(object(), {})
+        case.tearDown()
+        self.assertNotIn("butler", vars(case))
+        self.assertIs(case.butler, classButler)
+
+        SharedButlerTests.tearDownClass()
+        self.assertFalse(hasattr(SharedButlerTests, "butler"))
+        self.assertFalse(hasattr(SharedButlerTests, "dataIds"))
+        self.assertFalse(hasattr(SharedButlerTests, "log"))
+
+
+class MemoryTester(lsst.utils.tests.MemoryTestCase):
+    """Test for file leaks."""
+
+
+def setup_module(module):
+    """Initialize pytest."""
+    lsst.utils.tests.init()
+
+
+if __name__ == "__main__":
+    lsst.utils.tests.init()
+    unittest.main()
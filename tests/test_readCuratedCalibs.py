@@ -0,0 +1,189 @@
+# This file is part of obs_base.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the curated calibration reading helpers.
+"""
+
+import datetime
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+import yaml
+from lsst.obs.base._read_curated_calibs import _parse_date, check_metadata, read_all
+
+TESTDIR = os.path.abspath(os.path.dirname(__file__))
+
+
+class ParseDateTestCase(unittest.TestCase):
+    """Test parsing of validity start dates from file names."""
+
+    def test_parse_date(self):
+        for date_str, expected in (
+            ("19700101T0000", datetime.datetime(1970, 1, 1)),
+            ("20150105t0115", datetime.datetime(2015, 1, 5, 1, 15)),
+            ("19800101T000000", datetime.datetime(1980, 1, 1)),
+            ("20220101T013015", datetime.datetime(2022, 1, 1, 1, 30, 15)),
+            ("2022-01-01T01:30:15", datetime.datetime(2022, 1, 1, 1, 30, 15)),
+            ("2022-01-01", datetime.datetime(2022, 1, 1)),
+            ("20220101", datetime.datetime(2022, 1, 1)),
+            # Not one of the fast formats; handled by dateutil.
+            ("2022-01-01 01:30", datetime.datetime(2022, 1, 1, 1, 30)),
+            # Compact names with the wrong number of digits must not be
+            # parsed by strptime, which accepts single-digit fields.
+            ("20220101T12", datetime.datetime(2022, 1, 1, 12)),
+        ):
+            with self.subTest(date_str=date_str):
+                self.assertEqual(_parse_date(date_str), expected)
+
+        for date_str in ("20220101T123", "202211", "2022111"):
+            with self.subTest(date_str=date_str):
+                with self.assertRaises(ValueError):
+                    _parse_date(date_str)
+
+
+class _Detector:
+    """Minimal detector with the methods used by `read_all`."""
+
+    def __init__(self, name, detector_id):
+        self._name = name
+        self._id = detector_id
+
+    def getName(self):
+        return self._name
+
+    def getId(self):
+        return self._id
+
+
+class _Camera(list):
+    """Minimal camera: a list of detectors with a name."""
+
+    def getName(self):
+        return "trivial_camera"
+
+
+class _Calib:
+    """Minimal curated calibration that only reads ECSV metadata."""
+
+    def __init__(self, path, metadata):
+        self.path = path
+        self._metadata = metadata
+
+    @classmethod
+    def readText(cls, path):
+        metadata = {}
+        with open(path) as f:
+            for line in f:
+                if match := re.match(r"# - (\w+): (.*)$", line):
+                    metadata[match.group(1)] = yaml.safe_load(match.group(2))
+        return cls(path, metadata)
+
+    def getMetadata(self):
+        return self._metadata
+
+
+class ReadAllTestCase(unittest.TestCase):
+    """Test reading curated calibrations from a directory tree."""
+
+    def setUp(self):
+        self.camera = _Camera([_Detector("ccd00", 0), _Detector("ccd01", 1)])
+        tmpDir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpDir, ignore_errors=True)
+        # The instrument name is taken from the directory above the calib
+        # type.
+        self.root = os.path.join(tmpDir, "trivial_camera", "defects")
+        shutil.copytree(os.path.join(TESTDIR, "trivial_camera", "defects"), self.root)
+
+    def copyDetector(self, detector_id):
+        """Copy the ccd00 defects to another detector directory, updating
+        their metadata unless ``detector_id`` is `None`.
+        """
+        path = os.path.join(self.root, "ccd01")
+        shutil.copytree(os.path.join(self.root, "ccd00"), path)
+        if detector_id is not None:
+            for name in os.listdir(path):
+                with open(os.path.join(path, name)) as f:
+                    text = f.read()
+                with open(os.path.join(path, name), "w") as f:
+                    f.write(text.replace("# - DETECTOR: 0", f"# - DETECTOR: {detector_id}"))
+
+    def test_read_all(self):
+        root = os.path.join(TESTDIR, "trivial_camera", "defects")
+        data, calib_type = read_all(root, self.camera, _Calib, ["instrument", "detector"], set())
+        self.assertEqual(calib_type, "defects")
+        self.assertEqual(list(data), [(root, "ccd00")])
+        self.assertEqual(
+            {date: os.path.basename(calib.path) for date, calib in data[(root, "ccd00")].items()},
+            {
+                datetime.datetime(1970, 1, 1): "19700101T0000.ecsv",
+                datetime.datetime(2015, 1, 5, 1, 15): "20150105t0115.ecsv",
+            },
+        )
+
+    def test_read_all_detectors(self):
+        self.copyDetector(1)
+        data, calib_type = read_all(self.root, self.camera, _Calib, ["instrument", "detector"], set())
+        self.assertEqual(calib_type, "defects")
+        self.assertEqual(set(data), {(self.root, "ccd00"), (self.root, "ccd01")})
+        for path, detector_id in ((self.root, "ccd00"), 0), ((self.root, "ccd01"), 1):
+            self.assertEqual(len(data[path]), 2)
+            for calib in data[path].values():
+                self.assertEqual(calib.getMetadata()["DETECTOR"], detector_id)
+
+    def test_unknown_detector(self):
+        camera = _Camera([_Detector("ccd01", 1)])
+        with self.assertRaisesRegex(RuntimeError, "Detector ccd00 not known"):
+            read_all(self.root, camera, _Calib, ["instrument", "detector"], set())
+
+    def test_no_data(self):
+        path = os.path.join(self.root, "ccd00")
+        for name in os.listdir(path):
+            os.remove(os.path.join(path, name))
+        with self.assertRaisesRegex(RuntimeError, "No data to ingest"):
+            read_all(self.root, self.camera, _Calib, ["instrument", "detector"], set())
+
+    def test_metadata_mismatch(self):
+        # With two detectors the paths are read in worker threads; the ccd01
+        # files still claim to be from detector 0.
+        self.copyDetector(None)
+        with self.assertRaisesRegex(ValueError, "Path and file metadata do not agree"):
+            read_all(self.root, self.camera, _Calib, ["instrument", "detector"], set())
+
+    def test_duplicate_valid_start(self):
+        path = os.path.join(self.root, "ccd00")
+        shutil.copy(os.path.join(path, "19700101T0000.ecsv"), os.path.join(path, "19700101T0000.yaml"))
+        with self.assertRaisesRegex(ValueError, "validity start 1970-01-01 00:00:00"):
+            read_all(self.root, self.camera, _Calib, ["instrument", "detector"], set())
+
+    def test_check_metadata(self):
+        calib = _Calib("calib.ecsv", {"INSTRUME": "TRIVIAL_Camera", "OBSTYPE": "defects", "DETECTOR": 0})
+        # Names are compared ignoring case.
+        check_metadata(calib, None, "Trivial_Camera", 0, None, "calib.ecsv", "Defects")
+        # The path metadata is reported as given.
+        with self.assertRaisesRegex(ValueError, "Path metadata: Trivial_Camera 1 None Defects"):
+            check_metadata(calib, None, "Trivial_Camera", 1, None, "calib.ecsv", "Defects")
+
+
+if __name__ == "__main__":
+    unittest.main()